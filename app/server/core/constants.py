@@ -5,6 +5,8 @@ This module defines constants used throughout the application for processing
 and flattening nested data structures, particularly for JSONL file uploads.
 """
 
+import os
+
 # Delimiter used to flatten nested dictionary keys
 # Example: {"user": {"address": {"city": "NYC"}}} becomes {"user__address__city": "NYC"}
 NESTED_FIELD_DELIMITER = "__"
@@ -12,3 +14,20 @@ NESTED_FIELD_DELIMITER = "__"
 # Delimiter used to index list items when flattening arrays
 # Example: {"tags": ["python", "data"]} becomes {"tags_0": "python", "tags_1": "data"}
 LIST_INDEX_DELIMITER = "_"
+
+# Number of rows inserted per executemany batch during bulk loads
+INSERT_BATCH_SIZE = 10_000
+
+# Seconds a bulk load waits for another connection's lock before failing
+SQLITE_BUSY_TIMEOUT = 30.0
+
+# Number of JSONL lines handed to a parser worker at a time
+JSONL_PARSE_BLOCK_SIZE = 10_000
+
+# Number of worker processes used to parse JSONL files larger than one block:
+# the CPUs this process may run on (not every platform can tell, so fall back
+# to the host's count), capped since a single writer consumes their output
+JSONL_PARSE_WORKERS = min(
+    len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1,
+    4
+)
@@ -4,35 +4,134 @@ import sqlite3
 import io
 import re
 import logging
-from typing import Dict, Any, List, Set
+import functools
+import contextlib
+import sys
+import multiprocessing
+import multiprocessing.pool
+from collections import deque
+from itertools import chain, islice, repeat
+from typing import Dict, Any, List, Set, Tuple, BinaryIO, Iterable, Iterator, Optional
 from .sql_security import (
     execute_query_safely,
     validate_identifier,
     SQLSecurityError
 )
-from .constants import NESTED_FIELD_DELIMITER, LIST_INDEX_DELIMITER
+from .constants import (
+    NESTED_FIELD_DELIMITER,
+    LIST_INDEX_DELIMITER,
+    INSERT_BATCH_SIZE,
+    JSONL_PARSE_BLOCK_SIZE,
+    JSONL_PARSE_WORKERS,
+    SQLITE_BUSY_TIMEOUT
+)
 
 logger = logging.getLogger(__name__)
 
+# Parse JSONL lines and JSON documents with orjson when available, straight
+# from bytes without first decoding a str copy; otherwise reuse a single
+# stdlib decoder rather than building one per json.loads call.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so either is caught
+# the same way.
+_decode_json = json.JSONDecoder().decode
+
+# UTF-8 byte order mark, which some editors write at the start of a file
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+try:
+    import orjson
+
+    def _loads_jsonl_line(line: bytes) -> Any:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which the stdlib accepts (and
+            # json.dumps writes by default), so retry before giving up
+            return _decode_json(line.decode('utf-8'))
+
+    def _loads_json_document(content: bytes) -> Any:
+        # orjson rejects a byte order mark; skip it through a view, not a copy
+        document = memoryview(content)[len(_UTF8_BOM):] if content.startswith(_UTF8_BOM) else content
+        try:
+            return orjson.loads(document)
+        except orjson.JSONDecodeError:
+            # NaN and Infinity, or text in another encoding such as UTF-16,
+            # which json.loads detects
+            return json.loads(content)
+except ImportError:
+    def _loads_jsonl_line(line: bytes) -> Any:
+        return _decode_json(line.decode('utf-8'))
+
+    _loads_json_document = json.loads
+
+# Characters not allowed in table names
+_BAD_TABLE_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+# Table names that need no cleaning at all
+_CLEAN_TABLE_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*\Z')
+
+# Characters replaced with underscores when cleaning column names
+_COLUMN_SEPARATORS = re.compile(r'[ -]')
+
+# Connection settings for bulk loads: temp tables kept in memory and a 64 MiB
+# page cache. The database keeps a real (WAL) journal with synchronous=NORMAL,
+# because every upload shares one database file: without a journal a crash
+# mid-load could corrupt every other table in it, not just the one being
+# rebuilt. A single load is one transaction, so it is only synced at commit.
+_BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# JSONL parser workers are started by a fork server rather than forked from
+# the (multi-threaded) web server process, where a child could inherit a lock
+# held by another thread along with the server's sockets. The fork server
+# preloads this module so each new worker doesn't import it again. Platforms
+# without a fork server spawn fresh interpreters instead.
+try:
+    _PARSE_POOL_CONTEXT = multiprocessing.get_context("forkserver")
+    _PARSE_POOL_CONTEXT.set_forkserver_preload([__name__])
+except ValueError:
+    _PARSE_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# Exact types produced by JSON parsers, compared by identity in hot loops
+# instead of isinstance()
+_dict = dict
+_list = list
+_NoneType = type(None)
+
+# Flattened keys repeat in every record, so they are interned to share one
+# string object per distinct key
+_intern = sys.intern
+
+@functools.lru_cache(maxsize=256)
 def sanitize_table_name(table_name: str) -> str:
     """
     Sanitize table name for SQLite by removing/replacing bad characters
     and validating against SQL injection
+
+    The result depends only on the input string, so it is cached.
     """
     # Remove file extension if present
     if '.' in table_name:
         table_name = table_name.rsplit('.', 1)[0]
     
-    # Replace bad characters with underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', table_name)
-    
-    # Ensure it starts with a letter or underscore
-    if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
-        sanitized = '_' + sanitized
-    
-    # Ensure it's not empty
-    if not sanitized:
-        sanitized = 'table'
+    if _CLEAN_TABLE_NAME.match(table_name):
+        # Already a plain identifier; only the keyword check below applies
+        sanitized = table_name
+    else:
+        # Replace bad characters with underscores
+        sanitized = _BAD_TABLE_NAME_CHARS.sub('_', table_name)
+        
+        # Ensure it starts with a letter or underscore
+        if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
+            sanitized = '_' + sanitized
+        
+        # Ensure it's not empty
+        if not sanitized:
+            sanitized = 'table'
     
     # Validate the sanitized name
     try:
@@ -43,64 +142,296 @@ def sanitize_table_name(table_name: str) -> str:
     
     return sanitized
 
+def _quote_identifier(identifier: str) -> str:
+    """
+    Quote an identifier for use in DDL, doubling any embedded double quotes
+    """
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+def _sqlite_column_type(dtype) -> str:
+    """
+    Map a pandas dtype to the SQLite column type pandas.to_sql would declare
+    """
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+def _sqlite_value_type(value_type: type) -> Optional[str]:
+    """
+    Return the SQLite column type for parsed JSON values of the given type
+    """
+    if value_type is _NoneType:
+        return None
+    if issubclass(value_type, (bool, int)):
+        return 'INTEGER'
+    if issubclass(value_type, float):
+        return 'REAL'
+    return 'TEXT'
+
+def _widen_sqlite_type(current: Optional[str], value_type: Optional[str]) -> Optional[str]:
+    """
+    Combine a column's type so far with the type of another value in it.
+
+    Integers widen to REAL when mixed with floats; any other mix becomes TEXT.
+    """
+    if current is None or current == value_type:
+        return value_type
+    if value_type is None:
+        return current
+    if {current, value_type} == {'INTEGER', 'REAL'}:
+        return 'REAL'
+    return 'TEXT'
+
+def _clean_column_name(column: str) -> str:
+    """
+    Clean a column name the same way for every file type
+    """
+    return _COLUMN_SEPARATORS.sub('_', column.lower())
+
+def _column_def(key: str, col_type: str) -> str:
+    """
+    Build the DDL for one column from a record key and its SQLite type
+    """
+    return f"{_quote_identifier(_clean_column_name(key))} {col_type}"
+
+def _retype_table(conn: sqlite3.Connection, table_name: str, types: Dict[str, str]) -> None:
+    """
+    Rebuild table_name with the column types in types, keeping its rows.
+
+    SQLite can't change a column's declared type in place, so the rows are
+    copied into a new table that then replaces the old one. Stored values
+    convert under the new column affinity: integers become reals in a REAL
+    column and text in a TEXT column.
+    """
+    table = _quote_identifier(table_name)
+    # Sanitized table names never contain '-', so this can't clash with an upload
+    rebuilt = _quote_identifier(f"{table_name}-retype")
+
+    column_defs = [_column_def(key, col_type) for key, col_type in types.items()]
+    conn.execute(f"DROP TABLE IF EXISTS {rebuilt}")
+    conn.execute(f"CREATE TABLE {rebuilt} ({', '.join(column_defs)})")
+    conn.execute(f"INSERT INTO {rebuilt} SELECT * FROM {table}")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {rebuilt} RENAME TO {table}")
+
+def _write_records(
+    conn: sqlite3.Connection,
+    table_name: str,
+    records: Iterable[Any],
+    columns: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    Replace table_name with the given records in a single transaction.
+
+    When columns (a mapping of column name to SQLite type) is given, the
+    schema is known up front: the table is created from it and records must
+    be tuples of values in column order. They are streamed straight into a
+    single executemany without being inspected one by one.
+
+    Otherwise records are dictionaries whose fields may vary between records.
+    They are inserted in batches of INSERT_BATCH_SIZE, and columns are
+    discovered while loading, in the order fields first appear: the table is
+    created from the first batch with any fields and any field first seen in
+    a later batch is added with ALTER TABLE ADD COLUMN, so the records are
+    only read once; rows inserted before a field's column exists simply read
+    NULL for it. A field that has only been null so far is declared TEXT. If
+    a later batch holds values a column's declared type can't represent (a
+    float in an INTEGER column, text in a numeric one, or any value in a
+    column that was null until then), the column's type is widened as
+    described in _widen_sqlite_type and the table is rebuilt with the new
+    type before the batch is inserted.
+
+    table_name must already be sanitized. The table is created without keys,
+    constraints or indexes so inserts never maintain a b-tree besides the
+    table itself. Any index added later must be created with CREATE INDEX
+    after the load has finished. The table is analyzed once loading is
+    complete.
+
+    Raises:
+        ValueError: If no columns are given and there are no records, or none
+            of them has any fields
+    """
+    table = _quote_identifier(table_name)
+
+    conn.execute("BEGIN")
+    with conn:
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+
+        if columns:
+            column_defs = [_column_def(key, col_type) for key, col_type in columns.items()]
+            conn.execute(f"CREATE TABLE {table} ({', '.join(column_defs)})")
+            conn.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})", records)
+        else:
+            types = {}  # record key -> type of its values so far (None while only null), in column order
+            empty_rows = 0  # empty records read before the table was created
+            records = iter(records)
+
+            while batch := list(islice(records, INSERT_BATCH_SIZE)):
+                # Each field's type across the batch, widened from its
+                # column's current type. Only the distinct (field, value type)
+                # pairs are examined, in the order fields first appear.
+                seen = {(key, type(value)): None for record in batch for key, value in record.items()}
+                batch_types = {}
+                for key, value_type in seen:
+                    batch_types[key] = _widen_sqlite_type(batch_types.get(key, types.get(key)), _sqlite_value_type(value_type))
+
+                if not types and not batch_types:
+                    # Only empty records so far; they're inserted as all-NULL
+                    # rows once a later batch creates the table
+                    empty_rows += len(batch)
+                    continue
+
+                new_fields = []
+                retype = False
+                for key, col_type in batch_types.items():
+                    if key not in types:
+                        new_fields.append(key)
+                    elif col_type != types[key]:
+                        # Null-only columns are declared TEXT, so a field's
+                        # first text values need no rebuild
+                        retype = retype or (col_type or 'TEXT') != (types[key] or 'TEXT')
+                        types[key] = col_type
+
+                if retype:
+                    _retype_table(conn, table_name, {key: col_type or 'TEXT' for key, col_type in types.items()})
+
+                if new_fields:
+                    # Column names are cleaned and quoted once, when first added
+                    column_defs = [_column_def(key, batch_types[key] or 'TEXT') for key in new_fields]
+                    if not types:
+                        conn.execute(f"CREATE TABLE {table} ({', '.join(column_defs)})")
+                    else:
+                        for column_def in column_defs:
+                            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_def}")
+
+                    for key in new_fields:
+                        types[key] = batch_types[key]
+                    fields = list(types)
+
+                    # The table's columns are exactly `fields`, in order
+                    insert_sql = f"INSERT INTO {table} VALUES ({', '.join('?' * len(fields))})"
+
+                    if empty_rows:
+                        conn.executemany(insert_sql, repeat((None,) * len(fields), empty_rows))
+                        empty_rows = 0
+
+                # Rows are built lazily as executemany consumes them
+                conn.executemany(insert_sql, (tuple(map(record.get, fields)) for record in batch))
+
+            if not types:
+                raise ValueError("Records contain no fields" if empty_rows else "No records found")
+
+        # Give the query planner row statistics for the new table
+        conn.execute(f"ANALYZE {table}")
+
+def _get_table_summary(conn: sqlite3.Connection, table_name: str) -> Dict[str, Any]:
+    """
+    Collect the schema, row count and first 5 rows of a freshly written table
+    """
+    # sqlite3.Row gives name-based access, so rows convert straight to dicts
+    conn.row_factory = sqlite3.Row
+
+    # Get schema information using safe query execution
+    columns_info = execute_query_safely(
+        conn,
+        "PRAGMA table_info({table})",
+        identifier_params={'table': table_name}
+    ).fetchall()
+    schema = {col['name']: col['type'] for col in columns_info}
+
+    # Get sample data using safe query execution
+    sample_rows = execute_query_safely(
+        conn,
+        "SELECT * FROM {table} LIMIT 5",
+        identifier_params={'table': table_name}
+    ).fetchall()
+    sample_data = [dict(row) for row in sample_rows]
+
+    # Get row count using safe query execution
+    row_count = execute_query_safely(
+        conn,
+        "SELECT COUNT(*) FROM {table}",
+        identifier_params={'table': table_name}
+    ).fetchone()[0]
+
+    return {
+        'table_name': table_name,
+        'schema': schema,
+        'row_count': row_count,
+        'sample_data': sample_data
+    }
+
+def _apply_pragmas(conn: sqlite3.Connection, pragmas: Iterable[str]) -> None:
+    """
+    Apply connection PRAGMAs, skipping any the database can't honour right now.
+
+    Switching the database into WAL mode needs a moment with no other
+    connection mid-transaction; if that doesn't come within the busy timeout,
+    loading simply proceeds with the current journal mode.
+    """
+    for pragma in pragmas:
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Skipping '{pragma}': {str(e)}")
+
+def _ingest(
+    records: Iterable[Dict[str, Any]],
+    table_name: str,
+    *,
+    columns: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Load records into a SQLite table and summarize the result.
+
+    This is the single write path shared by every converter; each converter
+    only parses its file format into record dictionaries.
+
+    Args:
+        records: Record dictionaries, or value tuples in column order when
+            columns is given, in any iterable (may be lazy)
+        table_name: Desired table name (will be sanitized)
+        columns: Optional mapping of column name to SQLite type, for sources
+            whose schema is known before any record is read
+
+    Returns:
+        Dictionary containing table_name, schema, row_count and sample_data
+    """
+    # Sanitize table name
+    table_name = sanitize_table_name(table_name)
+
+    # Connect to SQLite database, waiting for any other writer to finish
+    conn = sqlite3.connect("db/database.db", timeout=SQLITE_BUSY_TIMEOUT)
+    try:
+        _apply_pragmas(conn, _BULK_LOAD_PRAGMAS)
+
+        # Write records to SQLite (column names are cleaned on the way)
+        _write_records(conn, table_name, records, columns)
+
+        # Collect schema, row count and sample rows
+        return _get_table_summary(conn, table_name)
+    finally:
+        conn.close()
+
 def convert_csv_to_sqlite(csv_content: bytes, table_name: str) -> Dict[str, Any]:
     """
     Convert CSV file content to SQLite table
     """
     try:
-        # Sanitize table name
-        table_name = sanitize_table_name(table_name)
-        
         # Read CSV into pandas DataFrame
         df = pd.read_csv(io.BytesIO(csv_content))
         
-        # Clean column names
-        df.columns = [col.lower().replace(' ', '_').replace('-', '_') for col in df.columns]
-        
-        # Connect to SQLite database
-        conn = sqlite3.connect("db/database.db")
+        # Declare columns from the dtypes pandas inferred for the whole file
+        columns = {col: _sqlite_column_type(dtype) for col, dtype in df.dtypes.items()}
         
-        # Write DataFrame to SQLite
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
+        # Convert each column to Python scalars in one C-level pass and zip
+        # them into row tuples; missing values stay NaN, which SQLite stores
+        # as NULL
+        rows = zip(*(df[col].tolist() for col in df.columns))
         
-        # Get schema information using safe query execution
-        cursor_info = execute_query_safely(
-            conn,
-            "PRAGMA table_info({table})",
-            identifier_params={'table': table_name}
-        )
-        columns_info = cursor_info.fetchall()
-        
-        schema = {}
-        for col in columns_info:
-            schema[col[1]] = col[2]  # column_name: data_type
-        
-        # Get sample data using safe query execution
-        cursor_sample = execute_query_safely(
-            conn,
-            "SELECT * FROM {table} LIMIT 5",
-            identifier_params={'table': table_name}
-        )
-        sample_rows = cursor_sample.fetchall()
-        column_names = [col[1] for col in columns_info]
-        sample_data = [dict(zip(column_names, row)) for row in sample_rows]
-        
-        # Get row count using safe query execution
-        cursor_count = execute_query_safely(
-            conn,
-            "SELECT COUNT(*) FROM {table}",
-            identifier_params={'table': table_name}
-        )
-        row_count = cursor_count.fetchone()[0]
-        
-        conn.close()
-        
-        return {
-            'table_name': table_name,
-            'schema': schema,
-            'row_count': row_count,
-            'sample_data': sample_data
-        }
+        return _ingest(rows, table_name, columns=columns)
         
     except Exception as e:
         raise Exception(f"Error converting CSV to SQLite: {str(e)}")
@@ -110,76 +441,29 @@ def convert_json_to_sqlite(json_content: bytes, table_name: str) -> Dict[str, An
     Convert JSON file content to SQLite table
     """
     try:
-        # Sanitize table name
-        table_name = sanitize_table_name(table_name)
-        
-        # Parse JSON
-        data = json.loads(json_content.decode('utf-8'))
+        # Parse JSON straight from bytes (UTF-8 with or without a byte
+        # order mark, or UTF-16/32, as json.loads accepts)
+        data = _loads_json_document(json_content)
         
         # Ensure it's a list of objects
-        if not isinstance(data, list):
+        if not isinstance(data, list) or not all(isinstance(record, dict) for record in data):
             raise ValueError("JSON must be an array of objects")
         
         if not data:
             raise ValueError("JSON array is empty")
         
-        # Convert to pandas DataFrame
-        df = pd.DataFrame(data)
-        
-        # Clean column names
-        df.columns = [col.lower().replace(' ', '_').replace('-', '_') for col in df.columns]
-        
-        # Connect to SQLite database
-        conn = sqlite3.connect("db/database.db")
-        
-        # Write DataFrame to SQLite
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
-        
-        # Get schema information using safe query execution
-        cursor_info = execute_query_safely(
-            conn,
-            "PRAGMA table_info({table})",
-            identifier_params={'table': table_name}
-        )
-        columns_info = cursor_info.fetchall()
-        
-        schema = {}
-        for col in columns_info:
-            schema[col[1]] = col[2]  # column_name: data_type
-        
-        # Get sample data using safe query execution
-        cursor_sample = execute_query_safely(
-            conn,
-            "SELECT * FROM {table} LIMIT 5",
-            identifier_params={'table': table_name}
-        )
-        sample_rows = cursor_sample.fetchall()
-        column_names = [col[1] for col in columns_info]
-        sample_data = [dict(zip(column_names, row)) for row in sample_rows]
-        
-        # Get row count using safe query execution
-        cursor_count = execute_query_safely(
-            conn,
-            "SELECT COUNT(*) FROM {table}",
-            identifier_params={'table': table_name}
-        )
-        row_count = cursor_count.fetchone()[0]
-        
-        conn.close()
-        
-        return {
-            'table_name': table_name,
-            'schema': schema,
-            'row_count': row_count,
-            'sample_data': sample_data
-        }
+        return _ingest(data, table_name)
         
     except Exception as e:
         raise Exception(f"Error converting JSON to SQLite: {str(e)}")
 
 def flatten_nested_dict(data: Dict[str, Any], parent_key: str = '', sep: str = NESTED_FIELD_DELIMITER) -> Dict[str, Any]:
     """
-    Recursively flatten a nested dictionary into a single-level dictionary.
+    Flatten a nested dictionary into a single-level dictionary.
+
+    Nesting is walked with an explicit stack rather than recursion, writing
+    every leaf straight into one output dictionary. Only exact dict and list
+    instances (as produced by JSON parsing) are treated as containers.
 
     Nested objects are flattened using the separator (default '__'):
         {"user": {"address": {"city": "NYC"}}} -> {"user__address__city": "NYC"}
@@ -189,7 +473,7 @@ def flatten_nested_dict(data: Dict[str, Any], parent_key: str = '', sep: str = N
 
     Args:
         data: Dictionary to flatten
-        parent_key: Parent key prefix for recursive calls
+        parent_key: Prefix applied to every top-level key
         sep: Separator to use between nested keys
 
     Returns:
@@ -202,32 +486,135 @@ def flatten_nested_dict(data: Dict[str, Any], parent_key: str = '', sep: str = N
         >>> flatten_nested_dict({"tags": ["a", "b", "c"]})
         {"tags_0": "a", "tags_1": "b", "tags_2": "c"}
     """
-    items = []
-
-    for k, v in data.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-        if isinstance(v, dict):
-            # Recursively flatten nested dictionaries
-            items.extend(flatten_nested_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            # Flatten lists with indexed keys
-            for i, item in enumerate(v):
-                list_key = f"{new_key}{LIST_INDEX_DELIMITER}{i}"
-                if isinstance(item, dict):
-                    # If list contains dicts, flatten them
-                    items.extend(flatten_nested_dict(item, list_key, sep=sep).items())
-                else:
-                    # For primitive values, convert to string
-                    items.append((list_key, item))
-        elif v is None:
-            # Preserve None values
-            items.append((new_key, None))
+    flattened = {}
+    # Each frame holds a key prefix, an iterator over the entries still to
+    # visit and whether they are list items. A nested container is walked to
+    # the end before its parent resumes, so keys come out in document order.
+    stack = [(parent_key, iter(data.items()), False)]
+
+    while stack:
+        prefix, entries, in_list = stack[-1]
+        for k, v in entries:
+            if in_list:
+                # Flatten lists with indexed keys
+                new_key = _intern(f"{prefix}{LIST_INDEX_DELIMITER}{k}")
+            else:
+                new_key = _intern(f"{prefix}{sep}{k}" if prefix else str(k))
+
+            if (t := type(v)) is _dict:
+                # Descend into nested dictionaries instead of recursing
+                stack.append((new_key, iter(v.items()), False))
+                break
+            elif t is _list and not in_list:
+                stack.append((new_key, enumerate(v), True))
+                break
+            else:
+                # Keep primitive and None values (and lists inside lists) as-is
+                flattened[new_key] = v
+        else:
+            # Every entry of this container has been visited
+            stack.pop()
+
+    return flattened
+
+def _flatten_jsonl_lines(numbered_lines: Iterable[Tuple[int, bytes]]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse and flatten (line number, raw line) pairs, skipping bad lines.
+
+    Blank lines are skipped; malformed lines and non-object records are
+    logged with their line number and skipped.
+    """
+    # Invalid UTF-8 is reported per line like any other malformed JSON
+    for line_num, line in numbered_lines:
+        if not line or line.isspace():
+            continue
+
+        try:
+            record = _loads_jsonl_line(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Line {line_num}: Malformed JSON - {str(e)}")
+            continue
+
+        if isinstance(record, dict):
+            yield flatten_nested_dict(record)
         else:
-            # Keep primitive values as-is
-            items.append((new_key, v))
+            logger.warning(f"Line {line_num}: Expected JSON object, got {type(record).__name__}")
 
-    return dict(items)
+def _flatten_jsonl_block(numbered_lines: List[Tuple[int, bytes]]) -> List[Dict[str, Any]]:
+    """
+    Parse and flatten one block of JSONL lines inside a worker process
+    """
+    return list(_flatten_jsonl_lines(numbered_lines))
+
+@contextlib.contextmanager
+def open_flattened_records(jsonl_stream: BinaryIO) -> Iterator[Iterator[Dict[str, Any]]]:
+    """
+    Context manager providing every JSONL record in the stream as a
+    flattened dictionary.
+
+    The stream is read one line at a time, so the raw file is never held in
+    memory. Blank lines are skipped; malformed lines and non-object records
+    are logged and skipped.
+
+    Files longer than one block of JSONL_PARSE_BLOCK_SIZE lines are parsed
+    in parallel: blocks are handed to a pool of JSONL_PARSE_WORKERS
+    processes, started through _PARSE_POOL_CONTEXT, with only a few blocks in
+    flight at once, and records are yielded in file order. The pool is
+    started on entry, so callers can open the records before they connect to
+    the database and no worker starts while a write transaction is open. It
+    is shut down on exit.
+
+    Args:
+        jsonl_stream: Binary file-like object containing JSONL content
+
+    Yields:
+        Iterator of flattened dictionaries, one for each valid JSON object
+    """
+    numbered_lines = enumerate(jsonl_stream, 1)
+    first_block = list(islice(numbered_lines, JSONL_PARSE_BLOCK_SIZE))
+
+    # A pool isn't worth starting for a single block or a single core
+    if len(first_block) < JSONL_PARSE_BLOCK_SIZE or JSONL_PARSE_WORKERS < 2:
+        yield chain(_flatten_jsonl_lines(first_block), _flatten_jsonl_lines(numbered_lines))
+        return
+
+    blocks = chain(
+        [first_block],
+        iter(lambda: list(islice(numbered_lines, JSONL_PARSE_BLOCK_SIZE)), [])
+    )
+    with _PARSE_POOL_CONTEXT.Pool(JSONL_PARSE_WORKERS) as pool:
+        yield _iter_pooled_records(pool, blocks)
+
+def _iter_pooled_records(
+    pool: multiprocessing.pool.Pool,
+    blocks: Iterable[List[Tuple[int, bytes]]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse blocks of JSONL lines in the pool, yielding records in file order
+    """
+    pending = deque()
+    for block in blocks:
+        pending.append(pool.apply_async(_flatten_jsonl_block, (block,)))
+        if len(pending) > JSONL_PARSE_WORKERS * 2:
+            yield from pending.popleft().get()
+    while pending:
+        yield from pending.popleft().get()
+
+def iter_flattened_records(jsonl_stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every JSONL record in the stream as a flattened dictionary.
+
+    Generator form of open_flattened_records, for callers that don't need
+    control over when the parser pool starts.
+
+    Args:
+        jsonl_stream: Binary file-like object containing JSONL content
+
+    Yields:
+        Flattened dictionary for each valid JSON object
+    """
+    with open_flattened_records(jsonl_stream) as records:
+        yield from records
 
 def collect_all_jsonl_fields(jsonl_content: bytes) -> Set[str]:
     """
@@ -246,52 +633,30 @@ def collect_all_jsonl_fields(jsonl_content: bytes) -> Set[str]:
         ValueError: If the file contains no valid JSON records
     """
     all_fields = set()
-    lines_processed = 0
     valid_records = 0
 
-    try:
-        content = jsonl_content.decode('utf-8')
-        lines = content.strip().split('\n')
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-
-            lines_processed += 1
-            try:
-                record = json.loads(line)
-                if isinstance(record, dict):
-                    flattened = flatten_nested_dict(record)
-                    all_fields.update(flattened.keys())
-                    valid_records += 1
-                else:
-                    logger.warning(f"Line {line_num}: Expected JSON object, got {type(record).__name__}")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Line {line_num}: Malformed JSON - {str(e)}")
-                continue
-
-        if valid_records == 0:
-            raise ValueError("No valid JSON records found in JSONL file")
-
-        logger.info(f"Processed {lines_processed} lines, found {valid_records} valid records with {len(all_fields)} unique fields")
-        return all_fields
-
-    except UnicodeDecodeError as e:
-        raise ValueError(f"Unable to decode file content: {str(e)}")
+    for flattened in iter_flattened_records(io.BytesIO(jsonl_content)):
+        all_fields.update(flattened)
+        valid_records += 1
 
-def convert_jsonl_to_sqlite(jsonl_content: bytes, table_name: str) -> Dict[str, Any]:
+    if valid_records == 0:
+        raise ValueError("No valid JSON records found in JSONL file")
+
+    logger.info(f"Found {valid_records} valid records with {len(all_fields)} unique fields")
+    return all_fields
+
+def convert_jsonl_stream_to_sqlite(jsonl_stream: BinaryIO, table_name: str) -> Dict[str, Any]:
     """
-    Convert JSONL file content to SQLite table.
+    Convert a JSONL stream to SQLite table.
 
     JSONL (JSON Lines) format consists of one JSON object per line. This function:
-    1. Scans all records to discover all possible fields (since schemas can vary)
-    2. Flattens nested objects and arrays using configured delimiters
-    3. Creates a pandas DataFrame with consistent schema
-    4. Writes to SQLite with proper sanitization and security
+    1. Flattens nested objects and arrays using configured delimiters
+    2. Inserts records in fixed-size batches, adding a column whenever a new
+       field appears (since schemas can vary)
+    3. Writes to SQLite with proper sanitization and security
 
     Args:
-        jsonl_content: Raw JSONL file content as bytes
+        jsonl_stream: Binary file-like object containing JSONL content
         table_name: Desired table name (will be sanitized)
 
     Returns:
@@ -313,87 +678,19 @@ def convert_jsonl_to_sqlite(jsonl_content: bytes, table_name: str) -> Dict[str,
             name, address__city, tags_0, tags_1
     """
     try:
-        # Sanitize table name
-        table_name = sanitize_table_name(table_name)
-
-        # Collect all possible fields across all records
-        all_fields = collect_all_jsonl_fields(jsonl_content)
-
-        # Parse JSONL line-by-line and build records list
-        records = []
-        content = jsonl_content.decode('utf-8')
-        lines = content.strip().split('\n')
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                record = json.loads(line)
-                if isinstance(record, dict):
-                    flattened = flatten_nested_dict(record)
-
-                    # Ensure all fields are present (fill missing with None)
-                    complete_record = {field: flattened.get(field, None) for field in all_fields}
-                    records.append(complete_record)
-            except json.JSONDecodeError:
-                # Skip malformed lines (already logged in collect_all_jsonl_fields)
-                continue
-
-        if not records:
-            raise ValueError("No valid records to process")
-
-        # Create pandas DataFrame
-        df = pd.DataFrame(records)
-
-        # Clean column names (same pattern as CSV converter)
-        df.columns = [col.lower().replace(' ', '_').replace('-', '_') for col in df.columns]
-
-        # Connect to SQLite database
-        conn = sqlite3.connect("db/database.db")
-
-        # Write DataFrame to SQLite
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
-
-        # Get schema information using safe query execution
-        cursor_info = execute_query_safely(
-            conn,
-            "PRAGMA table_info({table})",
-            identifier_params={'table': table_name}
-        )
-        columns_info = cursor_info.fetchall()
-
-        schema = {}
-        for col in columns_info:
-            schema[col[1]] = col[2]  # column_name: data_type
-
-        # Get sample data using safe query execution
-        cursor_sample = execute_query_safely(
-            conn,
-            "SELECT * FROM {table} LIMIT 5",
-            identifier_params={'table': table_name}
-        )
-        sample_rows = cursor_sample.fetchall()
-        column_names = [col[1] for col in columns_info]
-        sample_data = [dict(zip(column_names, row)) for row in sample_rows]
-
-        # Get row count using safe query execution
-        cursor_count = execute_query_safely(
-            conn,
-            "SELECT COUNT(*) FROM {table}",
-            identifier_params={'table': table_name}
-        )
-        row_count = cursor_count.fetchone()[0]
+        # Records are flattened lazily as the stream is read; any parser
+        # pool is started here, before the load opens its transaction
+        with open_flattened_records(jsonl_stream) as records:
+            return _ingest(records, table_name)
 
-        conn.close()
+    except Exception as e:
+        raise Exception(f"Error converting JSONL to SQLite: {str(e)}")
 
-        return {
-            'table_name': table_name,
-            'schema': schema,
-            'row_count': row_count,
-            'sample_data': sample_data
-        }
+def convert_jsonl_to_sqlite(jsonl_content: bytes, table_name: str) -> Dict[str, Any]:
+    """
+    Convert JSONL file content to SQLite table.
 
-    except Exception as e:
-        raise Exception(f"Error converting JSONL to SQLite: {str(e)}")
\ No newline at end of file
+    Wrapper around convert_jsonl_stream_to_sqlite for content that is
+    already in memory.
+    """
+    return convert_jsonl_stream_to_sqlite(io.BytesIO(jsonl_content), table_name)
@@ -37,7 +37,7 @@ from core.data_models import (
 )
 
 # Import core modules (to be implemented)
-from core.file_processor import convert_csv_to_sqlite, convert_json_to_sqlite, convert_jsonl_to_sqlite
+from core.file_processor import convert_csv_to_sqlite, convert_json_to_sqlite, convert_jsonl_stream_to_sqlite
 from core.llm_processor import generate_sql
 from core.sql_processor import execute_sql_safely, get_database_schema
 from core.insights import generate_insights
@@ -80,16 +80,14 @@ async def upload_file(file: UploadFile = File(...)) -> FileUploadResponse:
         # Generate table name from filename
         table_name = file.filename.rsplit('.', 1)[0].lower().replace(' ', '_')
 
-        # Read file content
-        content = await file.read()
-
         # Convert to SQLite based on file type
-        if file.filename.endswith('.csv'):
-            result = convert_csv_to_sqlite(content, table_name)
-        elif file.filename.endswith('.jsonl'):
-            result = convert_jsonl_to_sqlite(content, table_name)
+        if file.filename.endswith('.jsonl'):
+            # Stream JSONL line by line instead of reading the whole upload
+            result = convert_jsonl_stream_to_sqlite(file.file, table_name)
+        elif file.filename.endswith('.csv'):
+            result = convert_csv_to_sqlite(await file.read(), table_name)
         else:
-            result = convert_json_to_sqlite(content, table_name)
+            result = convert_json_to_sqlite(await file.read(), table_name)
         
         response = FileUploadResponse(
             table_name=result['table_name'],
@@ -217,7 +215,7 @@ async def health_check() -> HealthCheckResponse:
         # Check database connection
         conn = sqlite3.connect("db/database.db")
         cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
         tables = cursor.fetchall()
         conn.close()
         
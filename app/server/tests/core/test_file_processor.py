@@ -161,4 +161,54 @@ class TestFileProcessor:
         with pytest.raises(Exception) as exc_info:
             convert_json_to_sqlite(json_data, table_name)
         
-        assert "JSON array is empty" in str(exc_info.value)
\ No newline at end of file
+        assert "JSON array is empty" in str(exc_info.value)
+    
+    def test_convert_json_to_sqlite_array_of_non_objects(self):
+        # Test with JSON array containing values that aren't objects
+        json_data = b'[{"name": "John"}, 42]'
+        table_name = "test_table"
+        
+        with pytest.raises(Exception) as exc_info:
+            convert_json_to_sqlite(json_data, table_name)
+        
+        assert "JSON must be an array of objects" in str(exc_info.value)
+    
+    def test_convert_json_to_sqlite_column_order(self, test_db):
+        # Test that columns follow first appearance, including null-only fields
+        json_data = b'[{"a": null, "b": 1}, {"a": null, "b": 2, "c": "x"}]'
+        table_name = "ordered"
+        
+        result = convert_json_to_sqlite(json_data, table_name)
+        
+        assert list(result['schema']) == ['a', 'b', 'c']
+        assert result['schema'] == {'a': 'TEXT', 'b': 'INTEGER', 'c': 'TEXT'}
+    
+    def test_convert_json_to_sqlite_utf8_bom(self, test_db):
+        # Test with JSON saved with a UTF-8 byte order mark
+        json_data = b'\xef\xbb\xbf[{"name": "Caf\xc3\xa9", "price": 3.5}]'
+        table_name = "bom_products"
+        
+        result = convert_json_to_sqlite(json_data, table_name)
+        
+        assert result['row_count'] == 1
+        assert result['sample_data'][0]['name'] == 'Café'
+    
+    def test_convert_json_to_sqlite_utf16(self, test_db):
+        # Test with JSON saved as UTF-16
+        json_data = '[{"name": "Café", "price": 3.5}]'.encode('utf-16')
+        table_name = "utf16_products"
+        
+        result = convert_json_to_sqlite(json_data, table_name)
+        
+        assert result['row_count'] == 1
+        assert result['sample_data'][0]['name'] == 'Café'
+    
+    def test_convert_json_to_sqlite_nan(self, test_db):
+        # Test with NaN and Infinity, as written by json.dumps
+        json_data = b'[{"score": 1.5}, {"score": NaN}, {"score": Infinity}]'
+        table_name = "scores"
+        
+        result = convert_json_to_sqlite(json_data, table_name)
+        
+        assert result['row_count'] == 3
+        assert [row['score'] for row in result['sample_data']] == [1.5, None, float('inf')]
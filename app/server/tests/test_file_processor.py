@@ -5,12 +5,15 @@ Unit tests for file processor module, focusing on JSONL functionality.
 import pytest
 import os
 import sqlite3
+from unittest.mock import patch
 from core.file_processor import (
     flatten_nested_dict,
     collect_all_jsonl_fields,
     convert_jsonl_to_sqlite,
+    convert_jsonl_stream_to_sqlite,
     sanitize_table_name
 )
+from core import file_processor
 from core.constants import NESTED_FIELD_DELIMITER, LIST_INDEX_DELIMITER
 
 
@@ -41,6 +44,14 @@ class TestFlattenNestedDict:
         result = flatten_nested_dict(data)
         assert result == {"a__b__c__d": "deep"}
 
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test flattening nesting deeper than Python's recursion limit"""
+        data = "leaf"
+        for _ in range(2000):
+            data = {"n": data}
+        result = flatten_nested_dict(data)
+        assert result == {NESTED_FIELD_DELIMITER.join(["n"] * 2000): "leaf"}
+
     def test_list_of_primitives(self):
         """Test flattening lists with primitive values"""
         data = {"tags": ["python", "data", "ml"]}
@@ -109,6 +120,25 @@ class TestFlattenNestedDict:
             "metadata_0__value": "chrome"
         }
 
+    def test_key_order_follows_document(self):
+        """Test that flattened keys keep the order they appear in the document"""
+        data = {
+            "name": "Alice",
+            "address": {"city": "NYC"},
+            "items": [{"a": 1}, {"a": 2}, {"a": 3}],
+            "tags": ["x", "y"]
+        }
+        result = flatten_nested_dict(data)
+        assert list(result) == [
+            "name",
+            "address__city",
+            "items_0__a",
+            "items_1__a",
+            "items_2__a",
+            "tags_0",
+            "tags_1"
+        ]
+
 
 class TestCollectAllJsonlFields:
     """Tests for collect_all_jsonl_fields function"""
@@ -147,6 +177,18 @@ class TestCollectAllJsonlFields:
         # Should collect fields from valid lines only
         assert "name" in fields
 
+    def test_crlf_line_endings(self):
+        """Test collecting fields from a file with Windows line endings"""
+        jsonl_content = b'{"name": "Alice"}\r\n{"age": 30}\r\n\r\n'
+        fields = collect_all_jsonl_fields(jsonl_content)
+        assert fields == {"name", "age"}
+
+    def test_invalid_utf8_line(self):
+        """Test that a line with invalid UTF-8 is skipped like malformed JSON"""
+        jsonl_content = b'{"name": "Alice"}\n{"bad": "\xff"}\n{"age": 30}'
+        fields = collect_all_jsonl_fields(jsonl_content)
+        assert fields == {"name", "age"}
+
     def test_empty_file(self):
         """Test handling empty JSONL file"""
         jsonl_content = b''
@@ -211,6 +253,21 @@ class TestConvertJsonlToSqlite:
         conn.execute("DROP TABLE IF EXISTS test_varying")
         conn.close()
 
+    def test_nan_and_infinity(self):
+        """Test that NaN and Infinity, as written by json.dumps, are loaded"""
+        jsonl_content = b'{"a": 1}\n{"a": NaN}\n{"a": Infinity}\n{"a": 2}'
+        result = convert_jsonl_to_sqlite(jsonl_content, "test_nan")
+
+        assert result["row_count"] == 4
+
+        conn = sqlite3.connect("db/database.db")
+        values = [row[0] for row in conn.execute("SELECT a FROM test_nan")]
+        assert values == [1, None, float("inf"), 2]
+
+        # Cleanup
+        conn.execute("DROP TABLE IF EXISTS test_nan")
+        conn.close()
+
     def test_malformed_jsonl(self):
         """Test handling malformed JSONL"""
         jsonl_content = b'{"name": "Alice"}\n{invalid}\n{"name": "Bob"}'
@@ -311,6 +368,129 @@ class TestConvertJsonlToSqlite:
         conn.execute("DROP TABLE IF EXISTS test_events_full")
         conn.close()
 
+    def test_jsonl_stream(self):
+        """Test converting JSONL read directly from an open file"""
+        test_file_path = os.path.join(os.path.dirname(__file__), "test_data", "users.jsonl")
+        with open(test_file_path, "rb") as f:
+            result = convert_jsonl_stream_to_sqlite(f, "test_users_stream")
+
+        assert result["table_name"] == "test_users_stream"
+        assert result["row_count"] == 10
+        assert any("address" in key for key in result["schema"].keys())
+
+        # Cleanup
+        conn = sqlite3.connect("db/database.db")
+        conn.execute("DROP TABLE IF EXISTS test_users_stream")
+        conn.close()
+
+    def test_other_connection_open(self):
+        """Test loading while another connection has the database open"""
+        other = sqlite3.connect("db/database.db")
+        other.execute("SELECT COUNT(*) FROM sqlite_master").fetchall()
+        try:
+            result = convert_jsonl_to_sqlite(b'{"name": "Alice"}', "test_shared")
+            assert result["row_count"] == 1
+            assert other.execute("SELECT name FROM test_shared").fetchall() == [("Alice",)]
+        finally:
+            # Cleanup
+            other.execute("DROP TABLE IF EXISTS test_shared")
+            other.commit()
+            other.close()
+
+    def test_multiple_insert_batches(self):
+        """Test that records spanning several insert batches are all written"""
+        jsonl_content = b'\n'.join(b'{"id": %d}' % i for i in range(5))
+        with patch('core.file_processor.INSERT_BATCH_SIZE', 2):
+            result = convert_jsonl_to_sqlite(jsonl_content, "test_batches")
+
+        assert result["row_count"] == 5
+        assert result["schema"] == {"id": "INTEGER"}
+
+        # Cleanup
+        conn = sqlite3.connect("db/database.db")
+        conn.execute("DROP TABLE IF EXISTS test_batches")
+        conn.close()
+
+    def test_fields_discovered_in_later_batches(self):
+        """Test that fields first seen after the first batch get their own columns"""
+        jsonl_content = (
+            b'{"id": 1, "note": null}\n'
+            b'{"id": 2}\n'
+            b'{"id": 3, "note": 7, "tags": ["a"]}\n'
+            b'{"id": 4, "extra": null}'
+        )
+        with patch('core.file_processor.INSERT_BATCH_SIZE', 2):
+            result = convert_jsonl_to_sqlite(jsonl_content, "test_late_fields")
+
+        assert result["row_count"] == 4
+        assert result["schema"] == {"id": "INTEGER", "note": "INTEGER", "tags_0": "TEXT", "extra": "TEXT"}
+        assert list(result["schema"]) == ["id", "note", "tags_0", "extra"]
+        third = next(row for row in result["sample_data"] if row["id"] == 3)
+        assert third["note"] == 7
+        assert third["tags_0"] == "a"
+
+        # Cleanup
+        conn = sqlite3.connect("db/database.db")
+        conn.execute("DROP TABLE IF EXISTS test_late_fields")
+        conn.close()
+
+    def test_column_type_widened_in_later_batch(self):
+        """Test that values a column's type can't hold in a later batch widen it"""
+        jsonl_content = (
+            b'{"zip": 12345, "score": 1}\n'
+            b'{"zip": 94103, "score": 2}\n'
+            b'{"zip": "02134", "score": 2.5}'
+        )
+        with patch('core.file_processor.INSERT_BATCH_SIZE', 2):
+            result = convert_jsonl_to_sqlite(jsonl_content, "test_widened")
+
+        assert result["schema"] == {"zip": "TEXT", "score": "REAL"}
+        assert [row["zip"] for row in result["sample_data"]] == ["12345", "94103", "02134"]
+        assert [row["score"] for row in result["sample_data"]] == [1.0, 2.0, 2.5]
+
+        # Cleanup
+        conn = sqlite3.connect("db/database.db")
+        conn.execute("DROP TABLE IF EXISTS test_widened")
+        conn.close()
+
+    def test_empty_records_before_first_field(self):
+        """Test that a batch of empty records doesn't stop later fields loading"""
+        jsonl_content = b'{}\n{}\n{}\n{"name": "Alice"}'
+        with patch('core.file_processor.INSERT_BATCH_SIZE', 2):
+            result = convert_jsonl_to_sqlite(jsonl_content, "test_empty_first")
+
+        assert result["row_count"] == 4
+        assert result["schema"] == {"name": "TEXT"}
+        assert [row["name"] for row in result["sample_data"]] == [None, None, None, "Alice"]
+
+        # Cleanup
+        conn = sqlite3.connect("db/database.db")
+        conn.execute("DROP TABLE IF EXISTS test_empty_first")
+        conn.close()
+
+    def test_parallel_parsing(self):
+        """Test that multi-block files parsed by worker processes keep file order"""
+        lines = [b'{"id": %d, "user": {"name": "u%d"}}' % (i, i) for i in range(7)]
+        lines.insert(3, b'{invalid}')
+        context = file_processor._PARSE_POOL_CONTEXT
+        with patch('core.file_processor.JSONL_PARSE_BLOCK_SIZE', 2), \
+                patch('core.file_processor.JSONL_PARSE_WORKERS', 2), \
+                patch.object(context, 'Pool', wraps=context.Pool) as pool:
+            result = convert_jsonl_to_sqlite(b'\n'.join(lines), "test_parallel")
+
+        # Workers are never forked from this process
+        assert context.get_start_method() in ("forkserver", "spawn")
+        pool.assert_called_once_with(2)
+
+        assert result["row_count"] == 7
+        assert result["schema"] == {"id": "INTEGER", "user__name": "TEXT"}
+        assert [row["id"] for row in result["sample_data"]] == [0, 1, 2, 3, 4]
+
+        # Cleanup
+        conn = sqlite3.connect("db/database.db")
+        conn.execute("DROP TABLE IF EXISTS test_parallel")
+        conn.close()
+
 
 class TestSanitizeTableName:
     """Tests for sanitize_table_name function"""
@@ -326,6 +506,17 @@ class TestSanitizeTableName:
         assert sanitize_table_name("test table") == "test_table"
         assert sanitize_table_name("test@table") == "test_table"
 
+    def test_clean_name_unchanged(self):
+        """Test that names that are already valid identifiers pass through"""
+        assert sanitize_table_name("user_events_2024") == "user_events_2024"
+        assert sanitize_table_name("_staging") == "_staging"
+
+    def test_clean_keyword_name_replaced(self):
+        """Test that clean names that are SQL keywords are still rejected"""
+        result = sanitize_table_name("select")
+        assert result != "select"
+        assert result.startswith("table_")
+
     def test_starts_with_letter(self):
         """Test that table names starting with numbers get prefixed"""
         result = sanitize_table_name("123table")